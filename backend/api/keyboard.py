@@ -0,0 +1,92 @@
+"""
+Keyboard WebSocket router.
+Phone connects via WebSocket and streams typed text and key presses.
+
+Event formats:
+  { "type": "text", "text": "hello" }                    # batch of typed chars
+  { "type": "key",  "keys": ["ctrl", "c"] }               # chord
+  { "type": "key",  "keys": ["backspace"], "presses": 3 }  # repeated key
+
+The client batches keystrokes, so each "text" event becomes one injection
+call no matter how many characters it carries (at most MAX_TEXT_CHARS; longer
+events are dropped, the client splits pastes). The same events are also
+accepted on /ws/mouse: sending them there keeps them strictly ordered with
+clicks, since one socket is processed in order on a single task.
+
+Keyboard injection runs on a single worker thread so a long pyautogui.write
+(the non-Windows fallback types one character at a time) doesn't block the
+event loop. Handlers await each event before reading the next one, so ordering
+is guaranteed within one socket only: mouse events still run on the event loop,
+so injections from two different sockets may interleave.
+
+Connect with ?pin=<PIN> when a PIN is configured.
+"""
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from system import keyboard
+from state import app_state
+from api.auth import verify_ws_pin
+
+router = APIRouter(tags=["keyboard"])
+
+KEYBOARD_EVENTS = ("text", "key")
+MAX_TEXT_CHARS = 512  # must match MAX_TEXT_CHUNK in frontend/src/services/ws.js
+
+log = logging.getLogger(__name__)
+
+_injector = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kumanda-keyboard")
+
+
+def handle_event(event: dict) -> None:
+    """Inject a single "text" or "key" event. Unknown events are ignored."""
+    event_type = event.get("type")
+
+    if event_type == "text":
+        text = event.get("text")
+        if isinstance(text, str):
+            if len(text) > MAX_TEXT_CHARS:
+                log.warning("Dropped text event of %d chars (max %d)", len(text), MAX_TEXT_CHARS)
+                return
+            keyboard.type_text(text)
+
+    elif event_type == "key":
+        keys = event.get("keys")
+        if isinstance(keys, list) and all(isinstance(k, str) for k in keys):
+            presses = event.get("presses", 1)
+            if not isinstance(presses, int) or isinstance(presses, bool):
+                presses = 1
+            keyboard.press_keys(keys, presses)
+
+
+async def inject(event: dict) -> None:
+    """Run handle_event on the injection thread and wait for it to finish."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_injector, handle_event, event)
+
+
+@router.websocket("/ws/keyboard")
+async def keyboard_websocket(ws: WebSocket):
+    # Reject before accept so a stale-PIN client never sees the socket open
+    if not verify_ws_pin(ws.query_params.get("pin")):
+        await ws.close(code=4401)
+        return
+    await ws.accept()
+    app_state.register_ws(ws)
+    try:
+        while True:
+            raw = await ws.receive_text()
+            try:
+                event = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+
+            if isinstance(event, dict):
+                await inject(event)
+
+    except (WebSocketDisconnect, Exception):
+        pass
+    finally:
+        app_state.unregister_ws(ws)
@@ -6,17 +6,28 @@ Event formats:
   { "type": "move",   "dx": 5,   "dy": -3 }
   { "type": "click",  "button": "left" | "right" | "double" }
   { "type": "scroll", "dy": -3 }
+
+Keyboard "text" / "key" events (see api/keyboard.py) are accepted too, so
+typing and clicks sent over this socket are injected in the order sent.
+
+Connect with ?pin=<PIN> when a PIN is configured.
 """
 import json
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from system import mouse
+from api import keyboard as keyboard_api
 from state import app_state
+from api.auth import verify_ws_pin
 
 router = APIRouter(tags=["mouse"])
 
 
 @router.websocket("/ws/mouse")
 async def mouse_websocket(ws: WebSocket):
+    # Reject before accept so a stale-PIN client never sees the socket open
+    if not verify_ws_pin(ws.query_params.get("pin")):
+        await ws.close(code=4401)
+        return
     await ws.accept()
     app_state.register_ws(ws)
     try:
@@ -27,6 +38,9 @@ async def mouse_websocket(ws: WebSocket):
             except json.JSONDecodeError:
                 continue
 
+            if not isinstance(event, dict):
+                continue
+
             event_type = event.get("type")
 
             if event_type == "move":
@@ -47,6 +61,9 @@ async def mouse_websocket(ws: WebSocket):
                 dy = int(event.get("dy", 0))
                 mouse.scroll(dy)
 
+            elif event_type in keyboard_api.KEYBOARD_EVENTS:
+                await keyboard_api.inject(event)
+
     except (WebSocketDisconnect, Exception):
         pass
     finally:
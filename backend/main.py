@@ -22,6 +22,7 @@ from api.auth import PinAuthMiddleware
 from api import audio as audio_router
 from api import display as display_router
 from api import mouse as mouse_router
+from api import keyboard as keyboard_router
 
 
 # ── Startup Banner ────────────────────────────────────────────────────────────
@@ -57,7 +58,7 @@ async def lifespan(app: FastAPI):
 # ── App ──────────────────────────────────────────────────────────────────────
 app = FastAPI(
     title="Kumanda - PC Remote Controller",
-    description="Control your PC audio, display, and mouse from your phone.",
+    description="Control your PC audio, display, mouse and keyboard from your phone.",
     version="1.0.0",
     lifespan=lifespan,
 )
@@ -75,6 +76,7 @@ app.add_middleware(
 app.include_router(audio_router.router)
 app.include_router(display_router.router)
 app.include_router(mouse_router.router)
+app.include_router(keyboard_router.router)
 
 
 # ── Health ────────────────────────────────────────────────────────────────────
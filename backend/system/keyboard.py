@@ -0,0 +1,150 @@
+"""
+Keyboard control module.
+Types text and presses key chords on the host.
+
+On Windows, text is injected with a single SendInput call per batch using
+KEYEVENTF_UNICODE, so a whole pasted paragraph is one OS call instead of one
+pyautogui.press per character (and works for any Unicode character, not just
+what the active keyboard layout can produce). Other platforms fall back to
+pyautogui.write.
+"""
+import ctypes
+import logging
+import struct
+import sys
+
+import pyautogui
+
+pyautogui.FAILSAFE = False
+pyautogui.PAUSE = 0  # pyautogui.write would otherwise sleep 0.1s per character
+
+MAX_PRESSES = 50  # upper bound for a single repeated key event
+
+log = logging.getLogger(__name__)
+
+# ── Win32 SendInput ──────────────────────────────────────────────────────────
+_user32 = ctypes.WinDLL("user32", use_last_error=True) if sys.platform == "win32" else None
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+# Characters that must be real key presses; as Unicode packets most apps ignore them
+_VK_FOR_CHAR = {
+    "\n": 0x0D,  # VK_RETURN
+    "\t": 0x09,  # VK_TAB
+}
+
+ULONG_PTR = ctypes.c_size_t
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member; it must be present for sizeof(INPUT) to match
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
+
+if _user32 is not None:
+    _user32.SendInput.argtypes = [ctypes.c_uint, ctypes.POINTER(_INPUT), ctypes.c_int]
+    _user32.SendInput.restype = ctypes.c_uint
+
+
+# Records are packed straight into one buffer: building an _INPUT object per
+# key event costs far more than the SendInput call itself on long pastes.
+_INPUT_SIZE = ctypes.sizeof(_INPUT)
+_KI_OFFSET = _INPUT.u.offset + _INPUTUNION.ki.offset
+_TYPE_FMT = struct.Struct("L")   # INPUT.type (native unsigned long, like c_ulong)
+_KI_FMT = struct.Struct("HHL")   # KEYBDINPUT.wVk, wScan, dwFlags (native alignment)
+
+
+def _build_text_inputs(text: str) -> ctypes.Array:
+    """Translate text into an array of key-down/key-up INPUT records."""
+    events = []
+    for ch in text:
+        vk = _VK_FOR_CHAR.get(ch)
+        if vk is not None:
+            events.append((vk, 0, 0))
+            events.append((vk, 0, KEYEVENTF_KEYUP))
+            continue
+        # Characters outside the BMP are sent as two UTF-16 surrogate units
+        data = ch.encode("utf-16-le")
+        for i in range(0, len(data), 2):
+            unit = int.from_bytes(data[i:i + 2], "little")
+            events.append((0, unit, KEYEVENTF_UNICODE))
+            events.append((0, unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+
+    buf = bytearray(_INPUT_SIZE * len(events))
+    for n, (vk, scan, flags) in enumerate(events):
+        base = n * _INPUT_SIZE
+        _TYPE_FMT.pack_into(buf, base, INPUT_KEYBOARD)
+        _KI_FMT.pack_into(buf, base + _KI_OFFSET, vk, scan, flags)
+    return (_INPUT * len(events)).from_buffer(buf)
+
+
+# ── Public API ───────────────────────────────────────────────────────────────
+def type_text(text: str) -> bool:
+    """
+    Type a string as-is. The whole string is injected in one batch.
+    Returns False if Windows rejected some of the input (e.g. UIPI blocks
+    injection while an elevated window has focus).
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if not text:
+        return True
+
+    if _user32 is None:
+        pyautogui.write(text)
+        return True
+
+    inputs = _build_text_inputs(text)
+    sent = _user32.SendInput(len(inputs), inputs, _INPUT_SIZE)
+    if sent != len(inputs):
+        error = ctypes.get_last_error() if sys.platform == "win32" else 0
+        log.warning(
+            "SendInput injected %d of %d key events (error %d); text was dropped",
+            sent, len(inputs), error,
+        )
+        return False
+    return True
+
+
+def press_keys(keys: list[str], presses: int = 1) -> bool:
+    """
+    Press a single key or a chord (e.g. ["ctrl", "c"]) `presses` times.
+    Key names follow pyautogui (KEYBOARD_KEYS). Returns False if any key is unknown.
+    """
+    keys = [k.lower() for k in keys]
+    if not keys or not all(pyautogui.isValidKey(k) for k in keys):
+        return False
+
+    presses = max(1, min(MAX_PRESSES, presses))
+    if len(keys) == 1:
+        pyautogui.press(keys[0], presses=presses)
+    else:
+        for _ in range(presses):
+            pyautogui.hotkey(*keys)
+    return True
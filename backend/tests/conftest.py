@@ -0,0 +1,122 @@
+"""
+Shared fixtures. Replaces pyautogui and SendInput with recorders so the
+input routers can run without a desktop session.
+
+Run from backend/:  pip install pytest httpx && python -m pytest -q
+Add --bench to also run the throughput benchmarks.
+"""
+import os
+import sys
+import time
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeBackend:
+    """Records every injection call instead of touching the OS."""
+
+    VALID_KEYS = {
+        "a", "c", "v", "r", "ctrl", "shift", "alt", "win",
+        "backspace", "delete", "enter", "tab", "esc",
+        "left", "right", "up", "down",
+    }
+
+    def __init__(self):
+        self.calls = []
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> None:
+        """Block until `count` calls are recorded (socket handlers run async)."""
+        deadline = time.monotonic() + timeout
+        while len(self.calls) < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    # ── pyautogui surface ───────────────────────────────────────────────────
+    def write(self, text):
+        self.calls.append(("write", text))
+
+    def press(self, key, presses=1):
+        self.calls.append(("press", key, presses))
+
+    def hotkey(self, *keys):
+        self.calls.append(("hotkey", keys))
+
+    def isValidKey(self, key):
+        return key in self.VALID_KEYS
+
+    def moveRel(self, dx, dy, duration=0):
+        self.calls.append(("moveRel", dx, dy))
+
+    def click(self, button="left"):
+        self.calls.append(("click", button))
+
+    def doubleClick(self, button="left"):
+        self.calls.append(("doubleClick", button))
+
+    def scroll(self, dy):
+        self.calls.append(("scroll", dy))
+
+    # ── user32 surface ──────────────────────────────────────────────────────
+    def SendInput(self, count, array, size):
+        # Record the length only: keeping every ctypes array alive skews benchmarks via GC
+        self.calls.append(("SendInput", count, len(array)))
+        return count
+
+
+def pytest_addoption(parser):
+    parser.addoption("--bench", action="store_true", help="run throughput benchmarks")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "bench: throughput benchmark (needs --bench)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --bench")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip)
+
+
+_fake = FakeBackend()
+_pyautogui = types.ModuleType("pyautogui")
+for _name in ("write", "press", "hotkey", "isValidKey", "moveRel", "click", "doubleClick", "scroll"):
+    setattr(_pyautogui, _name, getattr(_fake, _name))
+sys.modules["pyautogui"] = _pyautogui
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    """Fresh call log; SendInput is left off (pyautogui fallback path)."""
+    from system import keyboard
+    _fake.calls.clear()
+    monkeypatch.setattr(keyboard, "_user32", None)
+    return _fake
+
+
+@pytest.fixture
+def fake_user32(fake_backend, monkeypatch):
+    """Same as fake_backend, but with the Windows SendInput path enabled."""
+    from system import keyboard
+    monkeypatch.setattr(keyboard, "_user32", fake_backend)
+    return fake_backend
+
+
+@pytest.fixture
+def client():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from api import keyboard as keyboard_api
+    from api import mouse as mouse_api
+    from state import app_state
+
+    app = FastAPI()
+    app.include_router(mouse_api.router)
+    app.include_router(keyboard_api.router)
+    app_state.pin = None
+    yield TestClient(app)
+    app_state.pin = None
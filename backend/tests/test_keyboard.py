@@ -0,0 +1,154 @@
+import json
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from api import keyboard as keyboard_api
+from state import app_state
+from system import keyboard
+
+
+def _records(inputs):
+    return [(i.u.ki.wVk, i.u.ki.wScan, i.u.ki.dwFlags) for i in inputs]
+
+
+UNI = keyboard.KEYEVENTF_UNICODE
+UP = keyboard.KEYEVENTF_KEYUP
+
+
+# ── system.keyboard ──────────────────────────────────────────────────────────
+def test_build_text_inputs_unicode_pairs():
+    assert _records(keyboard._build_text_inputs("ab")) == [
+        (0, ord("a"), UNI), (0, ord("a"), UNI | UP),
+        (0, ord("b"), UNI), (0, ord("b"), UNI | UP),
+    ]
+
+
+def test_build_text_inputs_surrogate_pair():
+    records = _records(keyboard._build_text_inputs("😀"))
+    assert [r[1] for r in records] == [0xD83D, 0xD83D, 0xDE00, 0xDE00]
+    assert [r[2] for r in records] == [UNI, UNI | UP, UNI, UNI | UP]
+
+
+def test_build_text_inputs_newline_and_tab_are_virtual_keys():
+    assert _records(keyboard._build_text_inputs("\n\t")) == [
+        (0x0D, 0, 0), (0x0D, 0, UP),
+        (0x09, 0, 0), (0x09, 0, UP),
+    ]
+
+
+def test_type_text_normalises_carriage_returns(fake_backend):
+    keyboard.type_text("a\r\nb\rc")
+    assert fake_backend.calls == [("write", "a\nb\nc")]
+
+
+def test_type_text_empty_is_noop(fake_user32):
+    keyboard.type_text("")
+    assert fake_user32.calls == []
+
+
+def test_type_text_single_sendinput_call(fake_user32):
+    keyboard.type_text("hi\n")
+    assert len(fake_user32.calls) == 1
+    assert fake_user32.calls == [("SendInput", 6, 6)]
+
+
+def test_press_keys_rejects_unknown_keys(fake_backend):
+    assert keyboard.press_keys(["ctrl", "nope"]) is False
+    assert keyboard.press_keys([]) is False
+    assert fake_backend.calls == []
+
+
+def test_press_keys_clamps_presses(fake_backend):
+    keyboard.press_keys(["Backspace"], presses=10_000)
+    assert fake_backend.calls == [("press", "backspace", keyboard.MAX_PRESSES)]
+
+
+def test_type_text_reports_partial_sendinput(fake_user32, monkeypatch):
+    monkeypatch.setattr(fake_user32, "SendInput", lambda count, array, size: 0)
+    assert keyboard.type_text("hi") is False
+
+
+# ── api.keyboard.handle_event ────────────────────────────────────────────────
+def test_handle_event_text_is_one_backend_call(fake_backend):
+    keyboard_api.handle_event({"type": "text", "text": "x" * keyboard_api.MAX_TEXT_CHARS})
+    assert fake_backend.calls == [("write", "x" * keyboard_api.MAX_TEXT_CHARS)]
+
+
+def test_handle_event_drops_oversized_text(fake_user32):
+    keyboard_api.handle_event({"type": "text", "text": "x" * (keyboard_api.MAX_TEXT_CHARS + 1)})
+    assert fake_user32.calls == []
+
+
+def test_handle_event_key_burst_is_one_backend_call(fake_backend):
+    keyboard_api.handle_event({"type": "key", "keys": ["backspace"], "presses": 20})
+    assert fake_backend.calls == [("press", "backspace", 20)]
+
+
+def test_handle_event_chord(fake_backend):
+    keyboard_api.handle_event({"type": "key", "keys": ["ctrl", "c"], "presses": 2})
+    assert fake_backend.calls == [("hotkey", ("ctrl", "c"))] * 2
+
+
+@pytest.mark.parametrize("presses", ["x", None, float("inf"), 1.5, True, [3]])
+def test_handle_event_bad_presses_defaults_to_one(fake_backend, presses):
+    keyboard_api.handle_event({"type": "key", "keys": ["enter"], "presses": presses})
+    assert fake_backend.calls == [("press", "enter", 1)]
+
+
+@pytest.mark.parametrize("event", [
+    {"type": "text", "text": 5},
+    {"type": "text"},
+    {"type": "key", "keys": "ctrl"},
+    {"type": "key", "keys": ["ctrl", 1]},
+    {"type": "unknown"},
+])
+def test_handle_event_ignores_malformed(fake_backend, event):
+    keyboard_api.handle_event(event)
+    assert fake_backend.calls == []
+
+
+# ── WebSocket routers ────────────────────────────────────────────────────────
+def test_mouse_socket_keeps_click_and_key_order(client, fake_backend):
+    events = [
+        {"type": "text", "text": "ab"},
+        {"type": "click", "button": "left"},
+        {"type": "key", "keys": ["enter"]},
+        {"type": "click", "button": "right"},
+    ]
+    with client.websocket_connect("/ws/mouse") as ws:
+        for event in events:
+            ws.send_text(json.dumps(event))
+        fake_backend.wait_for(4)
+    assert fake_backend.calls == [
+        ("write", "ab"),
+        ("click", "left"),
+        ("press", "enter", 1),
+        ("click", "right"),
+    ]
+
+
+def test_malformed_key_event_keeps_socket_open(client, fake_backend):
+    with client.websocket_connect("/ws/mouse") as ws:
+        ws.send_text(json.dumps({"type": "key", "keys": ["enter"], "presses": "x"}))
+        ws.send_text("[1, 2]")
+        ws.send_text(json.dumps({"type": "click", "button": "left"}))
+        fake_backend.wait_for(2)
+    assert fake_backend.calls == [("press", "enter", 1), ("click", "left")]
+
+
+@pytest.mark.parametrize("path", ["/ws/mouse", "/ws/keyboard"])
+def test_socket_rejects_wrong_pin_before_accept(client, fake_backend, path):
+    app_state.pin = "1234"
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"{path}?pin=0000"):
+            pass
+    assert exc.value.code == 4401
+
+
+def test_socket_accepts_correct_pin(client, fake_backend):
+    app_state.pin = "1234"
+    with client.websocket_connect("/ws/keyboard?pin=1234") as ws:
+        ws.send_text(json.dumps({"type": "text", "text": "ok"}))
+        fake_backend.wait_for(1)
+    assert fake_backend.calls == [("write", "ok")]
@@ -0,0 +1,78 @@
+"""
+Throughput benchmarks for keyboard injection against the fake backend.
+Marked `bench` and skipped by default; run with:
+
+    python -m pytest -q -s --bench tests/test_keyboard_throughput.py
+"""
+import gc
+import json
+import time
+
+import pytest
+
+from api import keyboard as keyboard_api
+
+pytestmark = pytest.mark.bench
+
+TEXT_SIZES = [1, 64, keyboard_api.MAX_TEXT_CHARS]
+ROUNDS = 200
+
+
+def _warm_up(backend, event):
+    """Prime ctypes array types and code paths so the first size isn't skewed."""
+    keyboard_api.handle_event(event)
+    backend.calls.clear()
+
+
+def _timed(fn):
+    """Run fn with GC paused (as timeit does) and return elapsed seconds."""
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _report(label, chars, elapsed):
+    print(f"\n  {label}: {chars / elapsed:,.0f} chars/sec ({chars} chars in {elapsed * 1000:.1f} ms)")
+
+
+@pytest.mark.parametrize("size", TEXT_SIZES)
+def test_sendinput_packing_throughput(fake_user32, size):
+    event = {"type": "text", "text": "x" * size}
+    _warm_up(fake_user32, event)
+
+    elapsed = _timed(lambda: [keyboard_api.handle_event(event) for _ in range(ROUNDS)])
+
+    _report(f"SendInput packing, {size}-char events", size * ROUNDS, elapsed)
+    # One text event → exactly one OS call carrying a down/up pair per char
+    assert len(fake_user32.calls) == ROUNDS
+    assert all(call[1] == 2 * size for call in fake_user32.calls)
+
+
+def test_sendinput_packing_surrogates_throughput(fake_user32):
+    text = "😀" * keyboard_api.MAX_TEXT_CHARS
+    event = {"type": "text", "text": text}
+    _warm_up(fake_user32, event)
+
+    elapsed = _timed(lambda: [keyboard_api.handle_event(event) for _ in range(ROUNDS)])
+
+    _report("SendInput packing, emoji events", len(text) * ROUNDS, elapsed)
+    assert all(call[1] == 4 * len(text) for call in fake_user32.calls)
+
+
+@pytest.mark.parametrize("size", TEXT_SIZES)
+def test_mouse_socket_text_throughput(client, fake_user32, size):
+    payload = json.dumps({"type": "text", "text": "x" * size})
+
+    start = time.perf_counter()
+    with client.websocket_connect("/ws/mouse") as ws:
+        for _ in range(ROUNDS):
+            ws.send_text(payload)
+        fake_user32.wait_for(ROUNDS)
+    elapsed = time.perf_counter() - start
+
+    _report(f"/ws/mouse, {size}-char events", size * ROUNDS, elapsed)
+    assert len(fake_user32.calls) == ROUNDS
@@ -9,6 +9,10 @@ import { mouseWS } from '../services/ws';
  *   1 finger tap    → left click
  *   2 finger tap    → right click
  *   2 finger swipe  → scroll (vertical)
+ *
+ * The ⌨ button opens the phone keyboard; keystrokes are batched by mouseWS.
+ * While it's open, a Ctrl/Alt/Shift/Win row arms one-shot modifiers that are
+ * combined with the next key or character into a chord (e.g. Ctrl + c).
  */
 
 const SENSITIVITY = 2.5; // Multiply touch delta (Increased from 1.8)
@@ -16,12 +20,50 @@ const SCROLL_SENSITIVITY = 0.4; // Increased 5x for natural feel
 const TAP_MAX_MOVE = 8;    // px – above this is a drag, not a tap
 const TAP_MAX_TIME = 200;  // ms
 
+// beforeinput inputType → backend key name
+const INPUT_TYPE_KEYS = {
+    deleteContentBackward: 'backspace',
+    deleteContentForward: 'delete',
+    insertLineBreak: 'enter',
+    insertParagraph: 'enter',
+};
+
+// keydown key → backend key name. Backspace/Enter are handled here because the
+// input is kept empty, so browsers often skip beforeinput for them.
+const KEYDOWN_KEYS = {
+    Backspace: 'backspace', Enter: 'enter',
+    Tab: 'tab', Escape: 'esc',
+    ArrowLeft: 'left', ArrowRight: 'right', ArrowUp: 'up', ArrowDown: 'down',
+};
+
+// Modifier buttons, in the order they're placed in a chord
+const MODIFIERS = [
+    { key: 'ctrl', label: 'Ctrl' },
+    { key: 'alt', label: 'Alt' },
+    { key: 'shift', label: 'Shift' },
+    { key: 'win', label: 'Win' },
+];
+
+// Modifiers held on a hardware keyboard
+const heldModifiers = (e) => [
+    e.ctrlKey && 'ctrl', e.altKey && 'alt', e.shiftKey && 'shift', e.metaKey && 'win',
+].filter(Boolean);
+
+const mergeModifiers = (...lists) => {
+    const all = new Set(lists.flat());
+    return MODIFIERS.map(m => m.key).filter(k => all.has(k));
+};
+
 export default function MousepadPage() {
     const padRef = useRef(null);
     const touchDataRef = useRef(null); // stores start info
     const scrollIntervalRef = useRef(null);
+    const keyInputRef = useRef(null);
     const [connected, setConnected] = useState(false);
     const [feedback, setFeedback] = useState(null);
+    const [keyboardOpen, setKeyboardOpen] = useState(false);
+    const [armedMods, setArmedMods] = useState([]);
+    const armedModsRef = useRef([]); // read by the native key listeners
 
     // ── WebSocket lifecycle ───────────────────────────────────────────────
     useEffect(() => {
@@ -38,6 +80,113 @@ export default function MousepadPage() {
         };
     }, []);
 
+    // ── Keyboard capture ──────────────────────────────────────────────────
+    // Native listeners: React's onBeforeInput doesn't expose inputType.
+    //
+    // Android IMEs (Gboard etc.) type through composition: every update carries
+    // the whole word so far and can't be cancelled. To stream characters as
+    // they're typed, each update is diffed against what was already sent for
+    // this composition: backspaces for the part that changed, then the new
+    // suffix. The input is cleared once the composition ends.
+    useEffect(() => {
+        const input = keyInputRef.current;
+        if (!input) return;
+        let composed = ''; // text of the current composition already sent
+
+        const takeArmedMods = () => {
+            const mods = armedModsRef.current;
+            if (mods.length) {
+                armedModsRef.current = [];
+                setArmedMods([]);
+            }
+            return mods;
+        };
+        const emitKey = (key, held = []) => {
+            mouseWS.pressKeys([...mergeModifiers(takeArmedMods(), held), key]);
+        };
+        const emitText = (text) => {
+            if (!text) return;
+            const mods = takeArmedMods();
+            if (!mods.length) {
+                mouseWS.typeText(text);
+                return;
+            }
+            const [first, ...rest] = Array.from(text);
+            mouseWS.pressKeys([...mods, first.toLowerCase()]);
+            mouseWS.typeText(rest.join(''));
+        };
+        const syncComposition = (text = '') => {
+            const prev = Array.from(composed);
+            const next = Array.from(text);
+            let common = 0;
+            while (common < prev.length && common < next.length && prev[common] === next[common]) {
+                common++;
+            }
+            for (let i = common; i < prev.length; i++) mouseWS.pressKeys(['backspace']);
+            emitText(next.slice(common).join(''));
+            composed = text;
+        };
+
+        const onBeforeInput = (e) => {
+            if (e.isComposing || e.inputType === 'insertCompositionText'
+                || e.inputType === 'insertFromComposition') {
+                return; // streamed from the composition events
+            }
+            e.preventDefault(); // keep the input empty; the PC is the editor
+            const key = INPUT_TYPE_KEYS[e.inputType];
+            if (key) emitKey(key);
+            else emitText(e.data);
+        };
+        const onCompositionStart = () => {
+            composed = '';
+        };
+        const onCompositionUpdate = (e) => {
+            syncComposition(e.data);
+        };
+        const onCompositionEnd = (e) => {
+            syncComposition(e.data);
+            composed = '';
+            input.value = '';
+        };
+        const onKeyDown = (e) => {
+            if (e.isComposing) return; // the IME owns these keys
+            const held = heldModifiers(e);
+            const key = KEYDOWN_KEYS[e.key];
+            if (key) {
+                e.preventDefault(); // also suppresses the matching beforeinput
+                emitKey(key, held);
+            } else if (e.key.length === 1 && (e.ctrlKey || e.altKey || e.metaKey)) {
+                // Ctrl/Alt/Win + character: no beforeinput fires for these
+                e.preventDefault();
+                emitKey(e.key.toLowerCase(), held);
+            }
+        };
+
+        input.addEventListener('beforeinput', onBeforeInput);
+        input.addEventListener('compositionstart', onCompositionStart);
+        input.addEventListener('compositionupdate', onCompositionUpdate);
+        input.addEventListener('compositionend', onCompositionEnd);
+        input.addEventListener('keydown', onKeyDown);
+        return () => {
+            input.removeEventListener('beforeinput', onBeforeInput);
+            input.removeEventListener('compositionstart', onCompositionStart);
+            input.removeEventListener('compositionupdate', onCompositionUpdate);
+            input.removeEventListener('compositionend', onCompositionEnd);
+            input.removeEventListener('keydown', onKeyDown);
+        };
+    }, []);
+
+    const toggleModifier = (key) => {
+        const mods = armedModsRef.current;
+        armedModsRef.current = mods.includes(key) ? mods.filter(k => k !== key) : [...mods, key];
+        setArmedMods(armedModsRef.current);
+    };
+
+    const toggleKeyboard = () => {
+        if (keyboardOpen) keyInputRef.current?.blur();
+        else keyInputRef.current?.focus();
+    };
+
     const flash = (msg) => {
         setFeedback(msg);
         setTimeout(() => setFeedback(null), 600);
@@ -219,6 +368,29 @@ export default function MousepadPage() {
                 )}
             </div>
 
+            {/* Modifier row (one-shot, applies to the next key) */}
+            {keyboardOpen && (
+                <div style={{
+                    display: 'flex',
+                    gap: 8,
+                    padding: '8px 16px 0',
+                    background: 'var(--bg-1)',
+                    borderTop: '1px solid var(--border)',
+                }}>
+                    {MODIFIERS.map(({ key, label }) => (
+                        <button
+                            key={key}
+                            className={`btn ${armedMods.includes(key) ? 'btn-primary' : 'btn-ghost'}`}
+                            style={{ flex: 1, padding: '8px', fontSize: '0.8rem' }}
+                            onPointerDown={(e) => e.preventDefault()} // keep input focus
+                            onClick={() => toggleModifier(key)}
+                        >
+                            {label}
+                        </button>
+                    ))}
+                </div>
+            )}
+
             {/* Button row */}
             <div style={{
                 display: 'flex',
@@ -260,6 +432,26 @@ export default function MousepadPage() {
                 >
                     Right ▶
                 </button>
+                <button
+                    className={`btn ${keyboardOpen ? 'btn-primary' : 'btn-ghost'}`}
+                    style={{ padding: '14px', fontSize: '1rem' }}
+                    onPointerDown={(e) => e.preventDefault()} // keep input focus
+                    onClick={toggleKeyboard}
+                >
+                    ⌨
+                </button>
+                {/* Off-screen input that receives the phone keyboard */}
+                <input
+                    ref={keyInputRef}
+                    type="text"
+                    autoCapitalize="off"
+                    autoComplete="off"
+                    autoCorrect="off"
+                    spellCheck={false}
+                    onFocus={() => setKeyboardOpen(true)}
+                    onBlur={() => setKeyboardOpen(false)}
+                    style={{ position: 'absolute', opacity: 0, width: 1, height: 1, left: -100 }}
+                />
             </div>
         </div>
     );
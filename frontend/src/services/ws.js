@@ -1,19 +1,47 @@
 /**
  * WebSocket manager for the mousepad.
  * Auto-reconnects on disconnect. Sends JSON events to /ws/mouse.
+ *
+ * Keyboard input rides on the same socket so typing stays ordered with clicks.
+ * Keystrokes are queued and flushed once per frame: consecutive text is merged
+ * into one "text" event and repeated keys into one "key" event with a count.
+ * Queued keystrokes are held while the socket is (re)connecting and sent on open.
+ *
+ * A rejected PIN (close code 4401, or a refused handshake that /health confirms
+ * as 401) stops reconnecting, drops the queue and reloads into the PIN screen.
  */
+import { PIN_KEY } from './api';
 
 const WS_URL = () => {
     const { protocol, hostname, port } = window.location;
     const wsProto = protocol === 'https:' ? 'wss:' : 'ws:';
-    return `${wsProto}//${hostname}:${port}/ws/mouse`;
+    const pin = localStorage.getItem(PIN_KEY);
+    const query = pin ? `?pin=${encodeURIComponent(pin)}` : '';
+    return `${wsProto}//${hostname}:${port}/ws/mouse${query}`;
 };
 
+const FLUSH_MS = 16;         // keyboard batching window (~1 frame)
+const MAX_TEXT_CHUNK = 512;  // chars per "text" event; must match backend api/keyboard.py
+const MAX_PRESSES = 50;      // must match backend system/keyboard.py
+const CLOSE_UNAUTHORIZED = 4401;
+
+async function pinRejected() {
+    const pin = localStorage.getItem(PIN_KEY);
+    try {
+        const res = await fetch('/health', { headers: pin ? { 'X-PIN': pin } : {} });
+        return res.status === 401;
+    } catch {
+        return false; // server unreachable – keep retrying
+    }
+}
+
 class MouseWebSocket {
     constructor() {
         this.ws = null;
         this.reconnectTimer = null;
         this.shouldConnect = false;
+        this.pending = [];
+        this.flushTimer = null;
     }
 
     connect() {
@@ -23,34 +51,103 @@ class MouseWebSocket {
 
     _open() {
         if (this.ws) return;
-        this.ws = new WebSocket(WS_URL());
+        const ws = new WebSocket(WS_URL());
+        let opened = false;
+        this.ws = ws;
 
-        this.ws.onopen = () => {
+        ws.onopen = () => {
+            opened = true;
             console.log('[Kumanda] MouseWS connected');
             clearTimeout(this.reconnectTimer);
+            this.flush(); // keystrokes typed while reconnecting
         };
 
-        this.ws.onclose = () => {
-            console.log('[Kumanda] MouseWS closed, reconnecting...');
-            this.ws = null;
-            if (this.shouldConnect) {
-                this.reconnectTimer = setTimeout(() => this._open(), 1500);
+        ws.onclose = async (e) => {
+            if (this.ws === ws) this.ws = null;
+            if (!this.shouldConnect) return;
+            // Handshake refusals surface as 1006, so ask /health whether it was the PIN
+            if (e.code === CLOSE_UNAUTHORIZED || (!opened && await pinRejected())) {
+                this._unauthorized();
+                return;
             }
+            if (!this.shouldConnect) return; // disconnected while checking
+            console.log('[Kumanda] MouseWS closed, reconnecting...');
+            this.reconnectTimer = setTimeout(() => this._open(), 1500);
         };
 
-        this.ws.onerror = () => {
-            this.ws?.close();
+        ws.onerror = () => {
+            ws.close();
         };
     }
 
+    _unauthorized() {
+        console.log('[Kumanda] MouseWS PIN rejected');
+        this.disconnect();
+        localStorage.removeItem(PIN_KEY);
+        window.location.reload(); // App re-checks /health and shows PinPage
+    }
+
     send(event) {
+        this.flush(); // keep queued keystrokes ahead of this event
+        this._send(event);
+    }
+
+    _send(event) {
         if (this.ws?.readyState === WebSocket.OPEN) {
             this.ws.send(JSON.stringify(event));
         }
     }
 
+    /** Queue typed text. */
+    typeText(text) {
+        if (!text) return;
+        const last = this.pending[this.pending.length - 1];
+        if (last?.type === 'text') last.text += text;
+        else this.pending.push({ type: 'text', text });
+        this._scheduleFlush();
+    }
+
+    /** Queue a key or chord, e.g. ['backspace'] or ['ctrl', 'c']. */
+    pressKeys(keys) {
+        const last = this.pending[this.pending.length - 1];
+        if (last?.type === 'key' && last.presses < MAX_PRESSES
+            && last.keys.join('+') === keys.join('+')) {
+            last.presses += 1;
+        } else {
+            this.pending.push({ type: 'key', keys, presses: 1 });
+        }
+        this._scheduleFlush();
+    }
+
+    _scheduleFlush() {
+        if (!this.flushTimer) {
+            this.flushTimer = setTimeout(() => this.flush(), FLUSH_MS);
+        }
+    }
+
+    flush() {
+        clearTimeout(this.flushTimer);
+        this.flushTimer = null;
+        if (!this.isConnected()) return; // keep pending until onopen
+        const events = this.pending;
+        this.pending = [];
+        for (const event of events) {
+            if (event.type === 'text') {
+                const chars = Array.from(event.text); // don't split surrogate pairs
+                for (let i = 0; i < chars.length; i += MAX_TEXT_CHUNK) {
+                    this._send({ type: 'text', text: chars.slice(i, i + MAX_TEXT_CHUNK).join('') });
+                }
+            } else {
+                this._send(event);
+            }
+        }
+    }
+
     disconnect() {
         this.shouldConnect = false;
+        clearTimeout(this.flushTimer);
+        this.flushTimer = null;
+        this.pending = [];
         clearTimeout(this.reconnectTimer);
         this.ws?.close();
         this.ws = null;